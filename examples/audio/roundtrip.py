@@ -9,3 +9,7 @@ tts.say("Hello!", output="hello.mp3")
 stt = AudioAgent(llm="openai/whisper-1")
 text = stt.listen("hello.mp3")
 print(text)
+
+# Or in one call, with the PCM kept in memory (no mp3 written)
+text = AudioAgent().roundtrip("Hello!")
+print(text)
@@ -8,16 +8,75 @@ Follows the Agent() class patterns:
 - Async-safe with both sync and async methods
 """
 import os
+import re
+import hashlib
 import logging
+import threading
+from collections import OrderedDict
 from praisonaiagents._logging import get_logger
 import warnings
 from dataclasses import dataclass, field
-from typing import Optional, Any, Dict, Union, BinaryIO
+from typing import Optional, Any, Callable, Dict, List, Union, BinaryIO, TYPE_CHECKING
 from pathlib import Path
 
+if TYPE_CHECKING:
+    from .audio_cache import TTSCache
+
 # Filter out Pydantic warning about fields
 warnings.filterwarnings("ignore", "Valid config keys have changed in V2", UserWarning)
 
+logger = get_logger(__name__)
+
+# ─────────────────────────────────────────────────────────────────────────────
+# Sentence chunking for streaming TTS
+# ─────────────────────────────────────────────────────────────────────────────
+
+# Token ends a sentence: ., ? or ! optionally followed by closing quotes/brackets
+_SENTENCE_END_RE = re.compile(r'[.?!]+["\'\)\]]*$')
+# Token ends a clause: a comma, used as a boundary once the chunk is long enough
+_CLAUSE_END_RE = re.compile(r',["\'\)\]]*$')
+
+# Clause boundaries only split chunks with at least this many words
+_MIN_CLAUSE_WORDS = 4
+# Hard cap on words per chunk, so run-on text still streams
+_MAX_CHUNK_WORDS = 80
+# Maximum concurrent provider calls when streaming speech
+_STREAM_MAX_CONCURRENCY = 8
+# Formats whose encoded chunks can be appended back-to-back into one stream
+_STREAMABLE_FORMATS = frozenset({"mp3", "aac", "opus", "pcm"})
+# Arguments OpenAI's audio.speech.create() accepts from speech params
+_OPENAI_SPEECH_ARGS = frozenset({"model", "input", "voice", "speed", "response_format", "instructions"})
+# Largest single STT upload providers accept (OpenAI: 25 MB)
+_MAX_STT_UPLOAD_BYTES = 25 * 1024 * 1024
+# Read size when streaming a speech download to disk
+_DOWNLOAD_CHUNK_BYTES = 4096
+# Bytes buffered before the first write, so streaming readers of the
+# output file never start on a fragment too short to decode
+_DOWNLOAD_FIRST_FLUSH_BYTES = 12 * 1024
+
+
+def _is_sentence_boundary(buf: List[str], tok: str) -> bool:
+    """Return True if ``tok`` (already appended to ``buf``) closes a chunk."""
+    if _SENTENCE_END_RE.search(tok):
+        return True
+    if len(buf) >= _MIN_CLAUSE_WORDS and _CLAUSE_END_RE.search(tok):
+        return True
+    return len(buf) >= _MAX_CHUNK_WORDS
+
+
+def _split_sentences(text: str) -> List[str]:
+    """Split text into sentence-sized chunks for incremental synthesis."""
+    chunks = []
+    buf: List[str] = []
+    for tok in text.split():
+        buf.append(tok)
+        if _is_sentence_boundary(buf, tok):
+            chunks.append(" ".join(buf))
+            buf = []
+    if buf:
+        chunks.append(" ".join(buf))
+    return chunks
+
 # ─────────────────────────────────────────────────────────────────────────────
 # AudioConfig - Configuration dataclass following feature_configs.py patterns
 # ─────────────────────────────────────────────────────────────────────────────
@@ -39,6 +98,11 @@ class AudioConfig:
     language: Optional[str] = None
     temperature: float = 0.0
     
+    # TTS cache settings (disabled by default)
+    cache: bool = False
+    cache_dir: Optional[str] = None  # Defaults to ~/.praisonai/cache/tts
+    cache_max_bytes: int = 10 * 1024 * 1024
+    
     # Common settings
     timeout: int = 600
     
@@ -54,11 +118,63 @@ class AudioConfig:
             "response_format": self.response_format,
             "language": self.language,
             "temperature": self.temperature,
+            "cache": self.cache,
+            "cache_dir": self.cache_dir,
+            "cache_max_bytes": self.cache_max_bytes,
             "timeout": self.timeout,
             "api_base": self.api_base,
             "api_key": self.api_key,
         }
 
+class AudioResponse:
+    """
+    In-memory audio result mirroring the provider response interface.
+    
+    Returned when audio is served without a live provider response
+    (e.g. from the TTS cache), so callers can keep using
+    ``.content`` and ``stream_to_file()``.
+    """
+    
+    def __init__(self, content: bytes, response_format: str = "mp3"):
+        self.content = content
+        self.response_format = response_format
+    
+    def read(self) -> bytes:
+        """Return the raw audio bytes."""
+        return self.content
+    
+    def stream_to_file(self, file: Union[str, Path]) -> None:
+        """Write the audio bytes to ``file``."""
+        Path(file).write_bytes(self.content)
+    
+    def write_to_file(self, file: Union[str, Path]) -> None:
+        """Alias for stream_to_file()."""
+        self.stream_to_file(file)
+
+
+class AudioFileResponse(AudioResponse):
+    """
+    Audio result already written to disk, read back only on demand.
+    
+    Returned by streamed downloads so the audio is never held in memory;
+    ``.content`` loads the file the first time it is accessed.
+    """
+    
+    def __init__(self, path: Union[str, Path], response_format: str = "mp3"):
+        self.path = Path(path)
+        self.response_format = response_format
+    
+    @property
+    def content(self) -> bytes:
+        """Read the audio bytes from ``path``."""
+        return self.path.read_bytes()
+    
+    def stream_to_file(self, file: Union[str, Path]) -> None:
+        """Copy the audio file to ``file``."""
+        import shutil
+        if Path(file).resolve() != self.path.resolve():
+            shutil.copyfile(self.path, file)
+
 # ─────────────────────────────────────────────────────────────────────────────
 # AudioAgent Class - Agent-centric audio processing
 # ─────────────────────────────────────────────────────────────────────────────
@@ -99,12 +215,33 @@ class AudioAgent:
         text = agent.transcribe("audio.mp3")
         print(text)
         ```
+    
+    Connection reuse:
+        Sync speech() and transcribe() calls on OpenAI models share warm
+        SDK clients (one per base_url/API key, at most 64) over a single
+        keep-alive HTTP client; release them with AudioAgent.close_all().
+        Calls that override api_key/api_base, or rely on LiteLLM's global
+        key/endpoint settings, are not pooled. Async methods, speech(stream=True), sharded transcribe() and
+        transcribe_many() use LiteLLM's own clients instead.
     """
     
     # Default models
     DEFAULT_TTS_MODEL = "openai/tts-1"
     DEFAULT_STT_MODEL = "openai/whisper-1"
     
+    # LiteLLM module shared by all instances (imported on first use)
+    _litellm_module = None
+    # Keep-alive HTTP client shared by all instances (created on first use)
+    _http_client = None
+    # Warm provider SDK clients keyed by (provider, base_url, api_key hash),
+    # least recently used first
+    _client_pool: "OrderedDict[tuple, Any]" = OrderedDict()
+    _pool_lock = threading.Lock()
+    # Most warm clients kept at once (one per provider/base_url/key)
+    _MAX_POOLED_CLIENTS = 64
+    # Providers whose SDK client LiteLLM accepts via client=
+    _POOLED_PROVIDERS = frozenset({"openai"})
+    
     def __init__(
         self,
         # Core identity
@@ -151,6 +288,7 @@ class AudioAgent:
         # Lazy load LiteLLM
         self._litellm = None
         self._console = None
+        self._tts_cache = None
         
         self._configure_logging(verbose)
     
@@ -172,20 +310,50 @@ class AudioAgent:
             self._console = Console()
         return self._console
     
-    @property
-    def litellm(self):
-        """Lazy load litellm module when needed."""
-        if self._litellm is None:
+    @classmethod
+    def _load_litellm(cls):
+        """Import and configure litellm once per process."""
+        if AudioAgent._litellm_module is None:
             try:
                 import litellm
-                litellm.telemetry = False
-                litellm.success_callback = []
-                self._litellm = litellm
             except ImportError:
                 raise ImportError(
                     "litellm is required for audio processing. "
                     "Please install with: pip install litellm"
                 )
+            litellm.telemetry = False
+            litellm.success_callback = []
+            AudioAgent._litellm_module = litellm
+        return AudioAgent._litellm_module
+    
+    @classmethod
+    def _get_http_client(cls):
+        """
+        Create the shared keep-alive httpx client (HTTP/2 when h2 is installed).
+        
+        Only handed to AudioAgent's own SDK clients; LiteLLM's module-level
+        client_session is never touched.
+        """
+        if AudioAgent._http_client is None:
+            try:
+                import httpx
+            except ImportError:
+                return None
+            import importlib.util
+            http2 = importlib.util.find_spec("h2") is not None
+            limits = httpx.Limits(max_keepalive_connections=32, keepalive_expiry=60)
+            AudioAgent._http_client = httpx.Client(
+                http2=http2,
+                limits=limits,
+                transport=httpx.HTTPTransport(http2=http2, limits=limits, retries=2),
+            )
+        return AudioAgent._http_client
+    
+    @property
+    def litellm(self):
+        """Lazy load litellm module when needed."""
+        if self._litellm is None:
+            self._litellm = self._load_litellm()
         return self._litellm
     
     def _configure_logging(self, verbose: Union[bool, int]) -> None:
@@ -196,6 +364,92 @@ class AudioAgent:
             get_logger("litellm").setLevel(logging.WARNING)
             get_logger("httpx").setLevel(logging.WARNING)
     
+    @classmethod
+    def _make_client(cls, provider: str, base_url: Optional[str], api_key: Optional[str]):
+        """Build a provider SDK client on the shared HTTP client, or None if unavailable."""
+        if provider == "openai":
+            try:
+                import openai
+            except ImportError:
+                return None
+            return openai.OpenAI(
+                api_key=api_key,
+                base_url=base_url,
+                http_client=cls._get_http_client(),
+            )
+        return None
+    
+    def _get_pooled_client(self, model: str):
+        """Return the warm SDK client for ``model``'s provider, creating it once per process."""
+        provider = model.split("/", 1)[0] if "/" in model else "openai"
+        if provider not in self._POOLED_PROVIDERS:
+            return None
+        api_key = self.api_key or os.environ.get(f"{provider.upper()}_API_KEY")
+        if not api_key:
+            return None
+        
+        key = (provider, self.base_url, hashlib.sha256(api_key.encode()).hexdigest())
+        pool = AudioAgent._client_pool
+        with AudioAgent._pool_lock:
+            client = pool.get(key)
+            if client is not None:
+                pool.move_to_end(key)
+                return client
+            client = self._make_client(provider, self.base_url, api_key)
+            if client is None:
+                return None
+            pool[key] = client
+            # Evicted clients are just dropped: closing one would close the
+            # shared HTTP client the remaining clients still use
+            while len(pool) > self._MAX_POOLED_CLIENTS:
+                pool.popitem(last=False)
+        return client
+    
+    def _can_use_pooled_client(self, params: Dict[str, Any]) -> bool:
+        """
+        Check that the pooled client would send a call where LiteLLM would.
+        
+        LiteLLM uses a supplied client as-is, so pooling is skipped when the
+        call overrides api_key/api_base, or when credentials or endpoint come
+        from LiteLLM's globals or OPENAI_API_BASE / OPENAI_BASE_URL instead of
+        this agent.
+        """
+        if "client" in params:
+            return False
+        if params.get("api_key") != self.api_key or params.get("api_base") != self.base_url:
+            return False
+        litellm = self.litellm
+        if self.base_url is None and (
+            getattr(litellm, "api_base", None)
+            or os.environ.get("OPENAI_API_BASE")
+            or os.environ.get("OPENAI_BASE_URL")
+        ):
+            return False
+        if self.api_key is None and (
+            getattr(litellm, "api_key", None) or getattr(litellm, "openai_key", None)
+        ):
+            return False
+        return True
+    
+    def _with_pooled_client(self, params: Dict[str, Any]) -> Dict[str, Any]:
+        """Add the pooled SDK client to params for a sync LiteLLM call."""
+        if not self._can_use_pooled_client(params):
+            return params
+        client = self._get_pooled_client(params["model"])
+        if client is None:
+            return params
+        return {**params, "client": client}
+    
+    @classmethod
+    def close_all(cls) -> None:
+        """Release every pooled provider client and close the shared HTTP client."""
+        with AudioAgent._pool_lock:
+            AudioAgent._client_pool.clear()
+            client = AudioAgent._http_client
+            AudioAgent._http_client = None
+        if client is not None:
+            client.close()
+    
     def _get_model_params(self, model: Optional[str] = None) -> Dict[str, Any]:
         """Build parameters for LiteLLM calls."""
         params = {"model": model or self.llm}
@@ -205,10 +459,174 @@ class AudioAgent:
             params["api_base"] = self.base_url
         return params
     
+    def _run_sync(self, make_coro: Callable[[], Any]) -> Any:
+        """
+        Run an async helper to completion from a sync method.
+        
+        The coroutine is bounded by AudioConfig.timeout. When called from a
+        thread that already runs an event loop (Jupyter, FastAPI), it runs on
+        a private loop in a worker thread, which blocks the caller; prefer the
+        async variants (aspeech, atranscribe, atranscribe_many) there.
+        """
+        import asyncio
+        
+        timeout = self._audio_config.timeout
+        
+        async def runner():
+            return await asyncio.wait_for(make_coro(), timeout=timeout)
+        
+        try:
+            asyncio.get_running_loop()
+        except RuntimeError:
+            return asyncio.run(runner())
+        
+        import concurrent.futures
+        with concurrent.futures.ThreadPoolExecutor(max_workers=1) as pool:
+            return pool.submit(lambda: asyncio.run(runner())).result()
+    
     # ─────────────────────────────────────────────────────────────────────────
     # Text-to-Speech (TTS)
     # ─────────────────────────────────────────────────────────────────────────
     
+    def _build_speech_params(
+        self,
+        text: str,
+        voice: Optional[str],
+        speed: Optional[float],
+        response_format: Optional[str],
+        model: str,
+        kwargs: Dict[str, Any],
+    ) -> Dict[str, Any]:
+        """Build LiteLLM speech params, applying AudioConfig defaults."""
+        params = self._get_model_params(model)
+        params["input"] = text
+        params["voice"] = voice or self._audio_config.voice
+        
+        if speed is not None:
+            params["speed"] = speed
+        elif self._audio_config.speed != 1.0:
+            params["speed"] = self._audio_config.speed
+            
+        if response_format:
+            params["response_format"] = response_format
+        elif self._audio_config.response_format != "mp3":
+            params["response_format"] = self._audio_config.response_format
+        
+        params.update(kwargs)
+        return params
+    
+    def _get_tts_cache(
+        self,
+        cache: Optional[bool],
+        cache_dir: Optional[str],
+    ) -> Optional["TTSCache"]:
+        """Resolve the TTS cache for a call, or None when caching is off."""
+        enabled = cache if cache is not None else (
+            self._audio_config.cache or cache_dir is not None
+        )
+        if not enabled:
+            return None
+        
+        from .audio_cache import TTSCache, get_tts_cache_dir
+        resolved_dir = cache_dir or self._audio_config.cache_dir
+        target_dir = Path(resolved_dir).expanduser() if resolved_dir else get_tts_cache_dir()
+        if self._tts_cache is None or self._tts_cache.cache_dir != target_dir:
+            self._tts_cache = TTSCache(
+                cache_dir=target_dir,
+                max_bytes=self._audio_config.cache_max_bytes,
+            )
+        return self._tts_cache
+    
+    def _speech_from_cache(
+        self,
+        tts_cache: "TTSCache",
+        key: str,
+        ext: str,
+        output: Optional[str],
+    ) -> Optional[AudioResponse]:
+        """Serve a TTS request from the cache, copying to ``output`` on a hit."""
+        cached = tts_cache.get(key, ext)
+        if cached is None:
+            return None
+        if output:
+            tts_cache.copy_to(cached, output)
+            if self.verbose:
+                self.console.print(f"[green]✓ Audio saved to {output} (cached)[/green]")
+        return AudioResponse(cached.read_bytes(), response_format=ext)
+    
+    def _speech_to_cache(
+        self,
+        tts_cache: "TTSCache",
+        key: str,
+        ext: str,
+        response: Any,
+        output: Optional[str],
+    ) -> None:
+        """Store a fresh provider response in the cache, then copy to ``output``."""
+        cached = tts_cache.put(key, ext, response.content)
+        if output:
+            tts_cache.copy_to(cached, output)
+            if self.verbose:
+                self.console.print(f"[green]✓ Audio saved to {output}[/green]")
+    
+    def _can_stream_speech(self, params: Dict[str, Any]) -> bool:
+        """Check whether a speech request can be split into streamed chunks."""
+        ext = params.get("response_format", "mp3")
+        if ext not in _STREAMABLE_FORMATS:
+            logger.debug("stream=True not supported for %s output, using a single request", ext)
+            return False
+        return True
+    
+    async def _astream_speech(
+        self,
+        params: Dict[str, Any],
+        output: Optional[str],
+    ) -> AudioResponse:
+        """
+        Synthesize sentence chunks concurrently and append them in order.
+        
+        Every chunk request is started up front (bounded by
+        _STREAM_MAX_CONCURRENCY); chunks are written to ``output`` in
+        sentence order as soon as each one and its predecessors complete.
+        """
+        import asyncio
+        
+        chunks = _split_sentences(params["input"]) or [params["input"]]
+        semaphore = asyncio.Semaphore(_STREAM_MAX_CONCURRENCY)
+        
+        async def synthesize(chunk: str) -> bytes:
+            async with semaphore:
+                response = await self.litellm.aspeech(**{**params, "input": chunk})
+            return response.content
+        
+        if self.verbose:
+            self.console.print(
+                f"[cyan]Streaming speech with {params['model']} ({len(chunks)} chunks)...[/cyan]"
+            )
+        
+        tasks = [asyncio.create_task(synthesize(chunk)) for chunk in chunks]
+        parts: List[bytes] = []
+        out = open(output, "wb") if output else None
+        try:
+            for task in tasks:
+                data = await task
+                parts.append(data)
+                if out is not None:
+                    out.write(data)
+                    out.flush()
+        except BaseException:
+            for task in tasks:
+                task.cancel()
+            raise
+        finally:
+            if out is not None:
+                out.close()
+        
+        if output and self.verbose:
+            self.console.print(f"[green]✓ Audio saved to {output}[/green]")
+        
+        return AudioResponse(b"".join(parts), response_format=params.get("response_format", "mp3"))
+    
     def speech(
         self,
         text: str,
@@ -217,6 +635,9 @@ class AudioAgent:
         speed: Optional[float] = None,
         response_format: Optional[str] = None,
         model: Optional[str] = None,
+        cache: Optional[bool] = None,
+        cache_dir: Optional[str] = None,
+        stream: bool = False,
         **kwargs
     ) -> Any:
         """
@@ -224,11 +645,19 @@ class AudioAgent:
         
         Args:
             text: Text to convert to speech
-            output: Path to save audio file (optional)
+            output: Path to save audio file (optional). OpenAI models are
+                written to it chunk by chunk as the download arrives
             voice: Voice to use (e.g., "alloy", "echo", "fable")
             speed: Speech speed (0.25 to 4.0)
             response_format: Audio format (mp3, opus, aac, flac, wav)
             model: Override model for this call
+            cache: Serve repeated requests from the on-disk TTS cache.
+                Defaults to AudioConfig.cache (enabled when cache_dir is given)
+            cache_dir: TTS cache directory (default: ~/.praisonai/cache/tts)
+            stream: Split text on sentence boundaries and synthesize the
+                chunks concurrently, appending each to ``output`` in order
+                as soon as it is ready (mp3, aac, opus and pcm only).
+                Bounded by AudioConfig.timeout; inside an event loop use aspeech()
             **kwargs: Additional provider-specific parameters
             
         Returns:
@@ -238,40 +667,96 @@ class AudioAgent:
             ```python
             agent = AudioAgent(llm="openai/tts-1")
             agent.speech("Hello world!", output="hello.mp3")
+            
+            # Re-running the same text is served from disk
+            agent.speech("Hello world!", output="hello.mp3", cache=True)
+            
+            # First sentence is written while the rest is still synthesizing
+            agent.speech(long_text, output="story.mp3", stream=True)
             ```
         """
         # Resolve model
         model = model or self.llm or self.DEFAULT_TTS_MODEL
         
         # Build params
-        params = self._get_model_params(model)
-        params["input"] = text
-        params["voice"] = voice or self._audio_config.voice
+        params = self._build_speech_params(text, voice, speed, response_format, model, kwargs)
         
-        if speed is not None:
-            params["speed"] = speed
-        elif self._audio_config.speed != 1.0:
-            params["speed"] = self._audio_config.speed
-            
-        if response_format:
-            params["response_format"] = response_format
-        elif self._audio_config.response_format != "mp3":
-            params["response_format"] = self._audio_config.response_format
+        tts_cache = self._get_tts_cache(cache, cache_dir)
+        if tts_cache is not None:
+            key = tts_cache.make_key(params)
+            ext = params.get("response_format", "mp3")
+            cached = self._speech_from_cache(tts_cache, key, ext, output)
+            if cached is not None:
+                return cached
         
-        params.update(kwargs)
+        if stream and self._can_stream_speech(params):
+            response = self._run_sync(lambda: self._astream_speech(params, output))
+            if tts_cache is not None:
+                tts_cache.put(key, ext, response.content)
+            return response
         
         if self.verbose:
             self.console.print(f"[cyan]Generating speech with {model}...[/cyan]")
         
-        response = self.litellm.speech(**params)
+        if tts_cache is None and output:
+            response = self._stream_speech_download(params, output)
+            if response is not None:
+                if self.verbose:
+                    self.console.print(f"[green]✓ Audio saved to {output}[/green]")
+                return response
         
-        if output:
+        response = self.litellm.speech(**self._with_pooled_client(params))
+        
+        if tts_cache is not None:
+            self._speech_to_cache(tts_cache, key, ext, response, output)
+        elif output:
             response.stream_to_file(Path(output))
             if self.verbose:
                 self.console.print(f"[green]✓ Audio saved to {output}[/green]")
         
         return response
     
+    def _stream_speech_download(self, params: Dict[str, Any], output: str) -> Optional[AudioFileResponse]:
+        """
+        Download OpenAI speech straight into ``output`` while it arrives.
+        
+        Uses the pooled SDK client's ``with_streaming_response`` so disk
+        writes overlap the network transfer. The first ~12 KB are buffered
+        into a single write, then every chunk is written and flushed; the
+        body is never buffered, so peak memory stays at one chunk.
+        
+        Returns None when the request cannot take this path (non-OpenAI
+        model, no pooled client, or params the SDK call does not accept),
+        in which case the caller falls back to litellm.speech().
+        """
+        model = params["model"]
+        if "/" in model and not model.startswith("openai/"):
+            return None
+        if set(params) - _OPENAI_SPEECH_ARGS - {"api_key", "api_base"}:
+            return None
+        if not self._can_use_pooled_client(params):
+            return None
+        client = self._get_pooled_client(model)
+        if client is None:
+            return None
+        
+        args = {k: v for k, v in params.items() if k in _OPENAI_SPEECH_ARGS}
+        args["model"] = model.split("/", 1)[-1]
+        pending = bytearray()
+        with client.audio.speech.with_streaming_response.create(**args) as resp, open(output, "wb") as f:
+            for chunk in resp.iter_bytes(_DOWNLOAD_CHUNK_BYTES):
+                if pending is not None:
+                    pending.extend(chunk)
+                    if len(pending) < _DOWNLOAD_FIRST_FLUSH_BYTES:
+                        continue
+                    chunk = bytes(pending)
+                    pending = None
+                f.write(chunk)
+                f.flush()
+            if pending:
+                f.write(pending)
+        return AudioFileResponse(output, params.get("response_format", "mp3"))
+    
     async def aspeech(
         self,
         text: str,
@@ -280,28 +765,35 @@ class AudioAgent:
         speed: Optional[float] = None,
         response_format: Optional[str] = None,
         model: Optional[str] = None,
+        cache: Optional[bool] = None,
+        cache_dir: Optional[str] = None,
+        stream: bool = False,
         **kwargs
     ) -> Any:
         """Async version of speech()."""
         model = model or self.llm or self.DEFAULT_TTS_MODEL
         
-        params = self._get_model_params(model)
-        params["input"] = text
-        params["voice"] = voice or self._audio_config.voice
+        params = self._build_speech_params(text, voice, speed, response_format, model, kwargs)
         
-        if speed is not None:
-            params["speed"] = speed
-        elif self._audio_config.speed != 1.0:
-            params["speed"] = self._audio_config.speed
-            
-        if response_format:
-            params["response_format"] = response_format
+        tts_cache = self._get_tts_cache(cache, cache_dir)
+        if tts_cache is not None:
+            key = tts_cache.make_key(params)
+            ext = params.get("response_format", "mp3")
+            cached = self._speech_from_cache(tts_cache, key, ext, output)
+            if cached is not None:
+                return cached
         
-        params.update(kwargs)
+        if stream and self._can_stream_speech(params):
+            response = await self._astream_speech(params, output)
+            if tts_cache is not None:
+                tts_cache.put(key, ext, response.content)
+            return response
         
         response = await self.litellm.aspeech(**params)
         
-        if output:
+        if tts_cache is not None:
+            self._speech_to_cache(tts_cache, key, ext, response, output)
+        elif output:
             response.stream_to_file(Path(output))
         
         return response
@@ -310,12 +802,108 @@ class AudioAgent:
     # Speech-to-Text (STT / Transcription)
     # ─────────────────────────────────────────────────────────────────────────
     
+    def _build_transcription_params(
+        self,
+        language: Optional[str],
+        temperature: Optional[float],
+        model: str,
+        kwargs: Dict[str, Any],
+    ) -> Dict[str, Any]:
+        """Build LiteLLM transcription params (without the file), applying AudioConfig defaults."""
+        params = self._get_model_params(model)
+        
+        if language:
+            params["language"] = language
+        elif self._audio_config.language:
+            params["language"] = self._audio_config.language
+            
+        if temperature is not None:
+            params["temperature"] = temperature
+        elif self._audio_config.temperature != 0.0:
+            params["temperature"] = self._audio_config.temperature
+        
+        params.update(kwargs)
+        return params
+    
+    def _prepare_stt_file(
+        self,
+        file: Union[str, BinaryIO],
+        raw_pcm: bool,
+        trim_silence: bool,
+        sharded: bool = False,
+    ) -> Union[str, BinaryIO]:
+        """
+        Apply client-side PCM transcoding / silence trimming to a file path.
+        
+        Blocking (ffmpeg decode + VAD); async callers run it in a thread.
+        PCM is ~2x the size of a 128 kbit/s mp3, so for a single-request
+        upload that would exceed the provider cap the original file is sent.
+        """
+        if not isinstance(file, str) or not (raw_pcm or trim_silence):
+            return file
+        
+        from .audio_processing import ensure_pcm16k
+        pcm_path = ensure_pcm16k(file)
+        if trim_silence:
+            from .audio_processing import trim_silence as _trim_silence
+            pcm_path = _trim_silence(pcm_path).path
+        
+        pcm_size = pcm_path.stat().st_size
+        if not sharded and pcm_size > _MAX_STT_UPLOAD_BYTES and os.path.getsize(file) < pcm_size:
+            logger.warning(
+                "PCM copy of %s exceeds the %d MB upload limit; sending the original file "
+                "(use parallel_chunks= to upload PCM in shards)",
+                file, _MAX_STT_UPLOAD_BYTES // (1024 * 1024),
+            )
+            return file
+        return str(pcm_path)
+    
+    async def _atranscribe_sharded(
+        self,
+        file: str,
+        params: Dict[str, Any],
+        parallel_chunks: int,
+        chunk_seconds: float,
+        overlap_seconds: float,
+    ) -> str:
+        """
+        Transcribe a long file as overlapping shards in parallel.
+        
+        Shards are sent concurrently (at most ``parallel_chunks`` in flight)
+        and the transcripts are stitched on their overlapping words.
+        """
+        import asyncio
+        from .audio_processing import split_audio, stitch_transcripts
+        
+        shards = await asyncio.to_thread(
+            split_audio, file, chunk_seconds=chunk_seconds, overlap_seconds=overlap_seconds
+        )
+        semaphore = asyncio.Semaphore(parallel_chunks)
+        
+        async def transcribe_shard(shard) -> str:
+            async with semaphore:
+                response = await self.litellm.atranscription(**{**params, "file": shard.as_file()})
+            return response.text if hasattr(response, 'text') else str(response)
+        
+        if self.verbose:
+            self.console.print(
+                f"[cyan]Transcribing {len(shards)} shards with {params['model']}...[/cyan]"
+            )
+        
+        texts = await asyncio.gather(*(transcribe_shard(shard) for shard in shards))
+        return stitch_transcripts(list(texts))
+    
     def transcribe(
         self,
         file: Union[str, BinaryIO],
         language: Optional[str] = None,
         temperature: Optional[float] = None,
         model: Optional[str] = None,
+        parallel_chunks: Optional[int] = None,
+        chunk_seconds: float = 30.0,
+        overlap_seconds: float = 1.0,
+        raw_pcm: bool = False,
+        trim_silence: bool = False,
         **kwargs
     ) -> str:
         """
@@ -326,6 +914,20 @@ class AudioAgent:
             language: Language code (e.g., "en", "es", "fr")
             temperature: Sampling temperature (0.0 to 1.0)
             model: Override model for this call
+            parallel_chunks: Split a file path into overlapping shards and
+                transcribe up to this many concurrently (requires pydub).
+                Default None transcribes the whole file in one request.
+                Bounded by AudioConfig.timeout; inside an event loop use atranscribe()
+            chunk_seconds: Shard length when parallel_chunks is set
+            overlap_seconds: Overlap between shards when parallel_chunks is set
+            raw_pcm: Transcode a file path to 16 kHz mono int16 PCM WAV
+                client-side before upload (cached on disk, requires pydub),
+                so the provider skips decoding compressed audio. PCM is
+                256 kbit/s (~2x a 128k mp3) and hits OpenAI's 25 MB cap after
+                ~13 minutes; longer files fall back to the original upload
+                with a warning unless parallel_chunks is set
+            trim_silence: Shorten silences longer than 0.8s to 0.2s with
+                WebRTC VAD before upload (implies raw_pcm, requires webrtcvad)
             **kwargs: Additional provider-specific parameters
             
         Returns:
@@ -336,11 +938,28 @@ class AudioAgent:
             agent = AudioAgent(llm="openai/whisper-1")
             text = agent.transcribe("audio.mp3")
             print(text)
+            
+            # Long recordings: 30s shards, 8 at a time
+            text = agent.transcribe("podcast.mp3", parallel_chunks=8)
+            
+            # Drop long pauses before upload
+            text = agent.transcribe("podcast.mp3", trim_silence=True)
             ```
         """
         model = model or self.llm or self.DEFAULT_STT_MODEL
         
-        params = self._get_model_params(model)
+        params = self._build_transcription_params(language, temperature, model, kwargs)
+        
+        sharded = bool(parallel_chunks and parallel_chunks > 1)
+        file = self._prepare_stt_file(file, raw_pcm, trim_silence, sharded)
+        
+        if sharded and isinstance(file, str):
+            text = self._run_sync(lambda: self._atranscribe_sharded(
+                file, params, parallel_chunks, chunk_seconds, overlap_seconds
+            ))
+            if self.verbose:
+                self.console.print(f"[green]✓ Transcription complete[/green]")
+            return text
         
         # Handle file input
         if isinstance(file, str):
@@ -348,26 +967,15 @@ class AudioAgent:
         else:
             params["file"] = file
         
-        if language:
-            params["language"] = language
-        elif self._audio_config.language:
-            params["language"] = self._audio_config.language
-            
-        if temperature is not None:
-            params["temperature"] = temperature
-        elif self._audio_config.temperature != 0.0:
-            params["temperature"] = self._audio_config.temperature
-        
-        params.update(kwargs)
-        
         if self.verbose:
             self.console.print(f"[cyan]Transcribing with {model}...[/cyan]")
         
-        response = self.litellm.transcription(**params)
-        
-        # Close file if we opened it
-        if isinstance(file, str):
-            params["file"].close()
+        try:
+            response = self.litellm.transcription(**self._with_pooled_client(params))
+        finally:
+            # Close file if we opened it
+            if isinstance(file, str):
+                params["file"].close()
         
         text = response.text if hasattr(response, 'text') else str(response)
         
@@ -382,34 +990,229 @@ class AudioAgent:
         language: Optional[str] = None,
         temperature: Optional[float] = None,
         model: Optional[str] = None,
+        parallel_chunks: Optional[int] = None,
+        chunk_seconds: float = 30.0,
+        overlap_seconds: float = 1.0,
+        raw_pcm: bool = False,
+        trim_silence: bool = False,
         **kwargs
     ) -> str:
         """Async version of transcribe()."""
         model = model or self.llm or self.DEFAULT_STT_MODEL
         
-        params = self._get_model_params(model)
+        params = self._build_transcription_params(language, temperature, model, kwargs)
+        
+        import asyncio
+        
+        # Transcoding and VAD are blocking; keep them off the event loop
+        sharded = bool(parallel_chunks and parallel_chunks > 1)
+        file = await asyncio.to_thread(self._prepare_stt_file, file, raw_pcm, trim_silence, sharded)
+        
+        if sharded and isinstance(file, str):
+            return await self._atranscribe_sharded(
+                file, params, parallel_chunks, chunk_seconds, overlap_seconds
+            )
         
         if isinstance(file, str):
             params["file"] = open(file, "rb")
         else:
             params["file"] = file
         
-        if language:
-            params["language"] = language
-        elif self._audio_config.language:
-            params["language"] = self._audio_config.language
+        try:
+            response = await self.litellm.atranscription(**params)
+        finally:
+            if isinstance(file, str):
+                params["file"].close()
+        
+        return response.text if hasattr(response, 'text') else str(response)
+    
+    # ─────────────────────────────────────────────────────────────────────────
+    # Batch Transcription
+    # ─────────────────────────────────────────────────────────────────────────
+    
+    def _is_rate_limit_error(self, error: Exception) -> bool:
+        """Check whether a provider error is an HTTP 429 rate limit."""
+        rate_limit_error = getattr(self.litellm, "RateLimitError", None)
+        if rate_limit_error is not None and isinstance(error, rate_limit_error):
+            return True
+        return getattr(error, "status_code", None) == 429
+    
+    async def atranscribe_many(
+        self,
+        files: List[Union[str, BinaryIO]],
+        concurrency: int = 16,
+        max_retries: int = 3,
+        **kwargs
+    ) -> List[str]:
+        """
+        Async batch transcription with bounded concurrency.
+        
+        Args:
+            files: Audio file paths or file-like objects
+            concurrency: Maximum transcriptions in flight at once
+            max_retries: Retries per file on rate-limit (429) errors,
+                with jittered exponential backoff. File-like inputs must be
+                seekable; each retry rewinds them to their starting offset
+            **kwargs: Passed to atranscribe() for every file
             
-        if temperature is not None:
-            params["temperature"] = temperature
+        Returns:
+            Transcripts in the same order as ``files``
+        """
+        import asyncio
+        from .retry_utils import jittered_backoff
         
-        params.update(kwargs)
+        # A retry re-uploads the file, so file-like inputs must be rewindable
+        if max_retries > 0:
+            for f in files:
+                if not isinstance(f, str) and not (hasattr(f, "seekable") and f.seekable()):
+                    raise ValueError(
+                        "atranscribe_many() needs seekable file objects to retry; "
+                        "pass file paths or set max_retries=0"
+                    )
         
-        response = await self.litellm.atranscription(**params)
+        semaphore = asyncio.Semaphore(concurrency)
         
-        if isinstance(file, str):
-            params["file"].close()
+        async def transcribe_one(file: Union[str, BinaryIO]) -> str:
+            start = None if isinstance(file, str) or max_retries == 0 else file.tell()
+            async with semaphore:
+                for attempt in range(max_retries + 1):
+                    if attempt and start is not None:
+                        file.seek(start)
+                    try:
+                        return await self.atranscribe(file, **kwargs)
+                    except Exception as e:
+                        if attempt >= max_retries or not self._is_rate_limit_error(e):
+                            raise
+                        delay = jittered_backoff(attempt, base_delay=1.0, max_delay=30.0)
+                        logger.debug("Rate limited transcribing %s, retrying in %.1fs", file, delay)
+                        await asyncio.sleep(delay)
         
-        return response.text if hasattr(response, 'text') else str(response)
+        return list(await asyncio.gather(*(transcribe_one(f) for f in files)))
+    
+    def transcribe_many(
+        self,
+        files: List[Union[str, BinaryIO]],
+        concurrency: int = 16,
+        max_retries: int = 3,
+        **kwargs
+    ) -> List[str]:
+        """
+        Transcribe many audio files concurrently.
+        
+        The whole batch is bounded by AudioConfig.timeout. Inside an event
+        loop, await atranscribe_many() instead of blocking on this method.
+        
+        Args:
+            files: Audio file paths or file-like objects
+            concurrency: Maximum transcriptions in flight at once
+            max_retries: Retries per file on rate-limit (429) errors
+            **kwargs: Passed to transcribe() for every file
+            
+        Returns:
+            Transcripts in the same order as ``files``
+            
+        Example:
+            ```python
+            agent = AudioAgent(llm="groq/whisper-large-v3")
+            texts = agent.transcribe_many(["ep1.mp3", "ep2.mp3", "ep3.mp3"])
+            ```
+        """
+        if self.verbose:
+            self.console.print(
+                f"[cyan]Transcribing {len(files)} files (concurrency={concurrency})...[/cyan]"
+            )
+        
+        texts = self._run_sync(lambda: self.atranscribe_many(
+            files, concurrency=concurrency, max_retries=max_retries, **kwargs
+        ))
+        
+        if self.verbose:
+            self.console.print(f"[green]✓ Transcribed {len(texts)} files[/green]")
+        
+        return texts
+    
+    # ─────────────────────────────────────────────────────────────────────────
+    # Roundtrip (TTS → STT)
+    # ─────────────────────────────────────────────────────────────────────────
+    
+    def _roundtrip_wav(
+        self,
+        response: Any,
+        pcm_sample_rate: int,
+        save_to: Optional[str],
+    ) -> BinaryIO:
+        """Wrap PCM speech output as an in-memory WAV, optionally saving a copy."""
+        from .audio_processing import pcm_to_wav_file
+        
+        wav = pcm_to_wav_file(response.content, pcm_sample_rate, name="roundtrip.wav")
+        if save_to:
+            Path(save_to).write_bytes(wav.getvalue())
+        return wav
+    
+    def roundtrip(
+        self,
+        text: str,
+        tts_model: Optional[str] = None,
+        stt_model: Optional[str] = None,
+        voice: Optional[str] = None,
+        pcm_sample_rate: int = 24000,
+        save_to: Optional[str] = None,
+        **kwargs
+    ) -> str:
+        """
+        Speak text and transcribe it back, without writing audio to disk.
+        
+        TTS is requested as raw PCM and handed to STT as an in-memory WAV,
+        skipping the mp3 encode/decode and file I/O of say() + listen().
+        
+        Args:
+            text: Text to speak
+            tts_model: TTS model (default: the agent's llm, else openai/tts-1)
+            stt_model: STT model (default: openai/whisper-1)
+            voice: Voice to use for TTS
+            pcm_sample_rate: Sample rate of the provider's PCM output
+                (OpenAI returns 24 kHz)
+            save_to: Optional path to also save the audio as WAV
+            **kwargs: Passed to transcribe()
+            
+        Returns:
+            Transcribed text
+            
+        Example:
+            ```python
+            agent = AudioAgent()
+            text = agent.roundtrip("Hello!")
+            print(text)
+            ```
+        """
+        response = self.speech(
+            text,
+            voice=voice,
+            response_format="pcm",
+            model=tts_model or self.llm or self.DEFAULT_TTS_MODEL,
+        )
+        wav = self._roundtrip_wav(response, pcm_sample_rate, save_to)
+        return self.transcribe(wav, model=stt_model or self.DEFAULT_STT_MODEL, **kwargs)
+    
+    async def aroundtrip(
+        self,
+        text: str,
+        tts_model: Optional[str] = None,
+        stt_model: Optional[str] = None,
+        voice: Optional[str] = None,
+        pcm_sample_rate: int = 24000,
+        save_to: Optional[str] = None,
+        **kwargs
+    ) -> str:
+        """Async version of roundtrip()."""
+        response = await self.aspeech(
+            text,
+            voice=voice,
+            response_format="pcm",
+            model=tts_model or self.llm or self.DEFAULT_TTS_MODEL,
+        )
+        wav = self._roundtrip_wav(response, pcm_sample_rate, save_to)
+        return await self.atranscribe(wav, model=stt_model or self.DEFAULT_STT_MODEL, **kwargs)
     
     # ─────────────────────────────────────────────────────────────────────────
     # Convenience Methods
@@ -440,6 +1243,7 @@ class AudioAgent:
         
         Args:
             file: Audio file to transcribe
+            **kwargs: Passed to transcribe() (e.g. parallel_chunks=8)
             
         Returns:
             Transcribed text
@@ -0,0 +1,188 @@
+"""
+Disk-backed LRU cache for AudioAgent Text-to-Speech output.
+
+Identical synthesis requests (same model, voice, format, options and text)
+are served from disk instead of re-calling the paid TTS provider. The same
+cache class also caps the PCM copies made for Speech-to-Text uploads.
+
+Layout:
+    <cache_dir>/<key>.<ext>   - cached audio bytes
+    <cache_dir>/index.json    - {key: [size, atime, ext]} used for LRU eviction
+"""
+import hashlib
+import json
+import os
+import shutil
+import tempfile
+import threading
+import time
+from pathlib import Path
+from typing import Any, Dict, Optional, Union
+
+from praisonaiagents._logging import get_logger
+
+logger = get_logger(__name__)
+
+# Default size cap for the TTS cache (10 MB)
+DEFAULT_TTS_CACHE_MAX_BYTES = 10 * 1024 * 1024
+
+# Request params that do not affect the synthesized audio
+_NON_KEY_PARAMS = frozenset({"api_key", "api_base", "timeout", "client"})
+
+# One index lock per cache directory, shared by every TTSCache on it
+_DIR_LOCKS: Dict[str, threading.Lock] = {}
+_DIR_LOCKS_GUARD = threading.Lock()
+
+
+def _lock_for(cache_dir: Path) -> threading.Lock:
+    """Return the process-wide lock guarding ``cache_dir``'s index."""
+    key = os.path.abspath(cache_dir)
+    with _DIR_LOCKS_GUARD:
+        lock = _DIR_LOCKS.get(key)
+        if lock is None:
+            lock = _DIR_LOCKS[key] = threading.Lock()
+        return lock
+
+
+def get_tts_cache_dir() -> Path:
+    """
+    Get the default TTS cache directory.
+
+    Returns:
+        Path to ~/.praisonai/cache/tts/
+    """
+    from ..paths import get_cache_dir
+    return get_cache_dir() / "tts"
+
+
+class TTSCache:
+    """
+    Content-addressed LRU cache for audio files.
+
+    Example:
+        ```python
+        cache = TTSCache()
+        key = cache.make_key({"model": "openai/tts-1", "voice": "alloy", "input": "Hi"})
+        path = cache.get(key, "mp3")
+        if path is None:
+            cache.put(key, "mp3", audio_bytes)
+        ```
+    """
+
+    INDEX_FILE = "index.json"
+
+    def __init__(
+        self,
+        cache_dir: Optional[Union[str, Path]] = None,
+        max_bytes: int = DEFAULT_TTS_CACHE_MAX_BYTES,
+    ):
+        self.cache_dir = Path(cache_dir).expanduser() if cache_dir else get_tts_cache_dir()
+        self.max_bytes = max_bytes
+        self._lock = _lock_for(self.cache_dir)
+
+    @staticmethod
+    def make_key(params: Dict[str, Any]) -> str:
+        """Build a stable content hash from the TTS request params."""
+        keyed = {k: v for k, v in params.items() if k not in _NON_KEY_PARAMS}
+        payload = json.dumps(keyed, sort_keys=True, default=str)
+        return hashlib.blake2b(payload.encode("utf-8"), digest_size=16).hexdigest()
+
+    def path_for(self, key: str, ext: str) -> Path:
+        """Return the on-disk path for a cache entry."""
+        return self.cache_dir / f"{key}.{ext}"
+
+    def get(self, key: str, ext: str) -> Optional[Path]:
+        """Return the cached file path for ``key``, or None on a miss."""
+        path = self.path_for(key, ext)
+        if not path.exists():
+            return None
+        with self._lock:
+            index = self._load_index()
+            index[key] = [path.stat().st_size, time.time(), ext]
+            self._save_index(index)
+        logger.debug("Audio cache hit: %s", key)
+        return path
+
+    def tmp_path_for(self, key: str, ext: str) -> Path:
+        """Create a unique scratch file inside the cache for writing an entry."""
+        self.cache_dir.mkdir(parents=True, exist_ok=True)
+        fd, tmp_path = tempfile.mkstemp(dir=self.cache_dir, prefix=f"{key}.", suffix=f".{ext}.tmp")
+        os.close(fd)
+        return Path(tmp_path)
+
+    def put(self, key: str, ext: str, data: bytes) -> Path:
+        """Store ``data`` under ``key`` and evict old entries if over the cap."""
+        # Write atomically so concurrent readers never see a partial file
+        tmp_path = self.tmp_path_for(key, ext)
+        tmp_path.write_bytes(data)
+        return self.put_file(key, ext, tmp_path)
+
+    def put_file(self, key: str, ext: str, src: Union[str, Path]) -> Path:
+        """
+        Move a file written at tmp_path_for() into the cache under ``key``.
+
+        Lets large entries be written straight to disk instead of held in memory.
+        """
+        path = self.path_for(key, ext)
+        size = Path(src).stat().st_size
+        os.replace(src, path)
+        with self._lock:
+            index = self._load_index()
+            index[key] = [size, time.time(), ext]
+            self._evict(index, keep=key)
+            self._save_index(index)
+        return path
+
+    def copy_to(self, path: Path, output: Union[str, Path]) -> None:
+        """Copy a cached entry to the caller's output path."""
+        shutil.copyfile(path, output)
+
+    def clear(self) -> None:
+        """Remove every cached entry."""
+        with self._lock:
+            if self.cache_dir.exists():
+                shutil.rmtree(self.cache_dir, ignore_errors=True)
+
+    # ─────────────────────────────────────────────────────────────────────────
+    # Index management
+    # ─────────────────────────────────────────────────────────────────────────
+
+    def _load_index(self) -> Dict[str, list]:
+        index_path = self.cache_dir / self.INDEX_FILE
+        try:
+            with open(index_path, "r", encoding="utf-8") as f:
+                return json.load(f)
+        except (OSError, ValueError):
+            return {}
+
+    def _save_index(self, index: Dict[str, list]) -> None:
+        if not self.cache_dir.exists():
+            return
+        index_path = self.cache_dir / self.INDEX_FILE
+        try:
+            fd, tmp_path = tempfile.mkstemp(dir=self.cache_dir, prefix="index.", suffix=".json.tmp")
+            with os.fdopen(fd, "w", encoding="utf-8") as f:
+                json.dump(index, f)
+            os.replace(tmp_path, index_path)
+        except OSError as e:
+            logger.debug("Failed to write audio cache index: %s", e)
+
+    def _evict(self, index: Dict[str, list], keep: Optional[str] = None) -> None:
+        """Drop least-recently-used entries until the cache fits ``max_bytes``."""
+        total = sum(entry[0] for entry in index.values())
+        if total <= self.max_bytes:
+            return
+        for key in sorted(index, key=lambda k: index[k][1]):
+            if total <= self.max_bytes:
+                break
+            if key == keep:
+                continue
+            size, _, ext = index.pop(key)
+            try:
+                self.path_for(key, ext).unlink()
+            except OSError:
+                pass
+            total -= size
+
+
+__all__ = ["TTSCache", "get_tts_cache_dir", "DEFAULT_TTS_CACHE_MAX_BYTES"]
@@ -0,0 +1,409 @@
+"""
+Client-side audio helpers for AudioAgent Speech-to-Text.
+
+Provides:
+- Transcoding to 16 kHz mono 16-bit PCM WAV (size-capped LRU cache on disk)
+- Voice-activity-based silence trimming before upload
+- Wrapping raw PCM bytes as an in-memory WAV upload
+- Splitting long audio files into overlapping shards for parallel STT
+- Stitching shard transcripts back together on their overlap
+
+Audio decoding uses pydub (lazy import); it needs ffmpeg for compressed
+formats such as mp3. Silence trimming uses webrtcvad (lazy import).
+
+Installation:
+    pip install pydub
+    pip install webrtcvad
+"""
+import hashlib
+import io
+import re
+import wave
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import List, Optional, Tuple, Union
+
+from praisonaiagents._logging import get_logger
+
+logger = get_logger(__name__)
+
+# Sample rate / channels / sample width used for audio sent to STT providers
+STT_SAMPLE_RATE = 16000
+STT_CHANNELS = 1
+STT_SAMPLE_WIDTH = 2  # bytes, i.e. int16
+
+# Default size cap for transcoded / trimmed PCM copies (512 MB, ~4.5 h of audio)
+DEFAULT_PCM_CACHE_MAX_BYTES = 512 * 1024 * 1024
+
+# VAD frame length (webrtcvad accepts 10, 20 or 30 ms)
+_VAD_FRAME_MS = 30
+
+# Longest word overlap checked when stitching shard transcripts
+_MAX_STITCH_NGRAM = 5
+
+_WORD_NORMALIZE_RE = re.compile(r"[^\w']+")
+
+
+@dataclass
+class AudioShard:
+    """A slice of a longer audio file, encoded as 16 kHz mono int16 WAV."""
+    index: int
+    start: float  # seconds
+    end: float  # seconds
+    data: bytes
+
+    def as_file(self) -> io.BytesIO:
+        """Return the shard as a named file-like object for upload."""
+        buf = io.BytesIO(self.data)
+        buf.name = f"shard_{self.index}.wav"
+        return buf
+
+
+def _require_pydub():
+    """Lazy import pydub with a helpful error message."""
+    try:
+        from pydub import AudioSegment
+        return AudioSegment
+    except ImportError:
+        raise ImportError(
+            "pydub is required for client-side audio processing. "
+            "Please install with: pip install pydub"
+        )
+
+
+def _require_webrtcvad():
+    """Lazy import webrtcvad with a helpful error message."""
+    try:
+        import webrtcvad
+        return webrtcvad
+    except ImportError:
+        raise ImportError(
+            "webrtcvad is required for silence trimming. "
+            "Please install with: pip install webrtcvad"
+        )
+
+
+def get_pcm_cache_dir() -> Path:
+    """
+    Get the directory holding transcoded PCM copies of STT inputs.
+
+    Returns:
+        Path to ~/.praisonai/cache/pcm/
+    """
+    from ..paths import get_cache_dir
+    return get_cache_dir() / "pcm"
+
+
+def _pcm_cache(cache_dir: Optional[Union[str, Path]], max_bytes: int):
+    """Open the LRU cache holding PCM copies (shares TTSCache's index/eviction)."""
+    from .audio_cache import TTSCache
+    return TTSCache(cache_dir or get_pcm_cache_dir(), max_bytes=max_bytes)
+
+
+def _source_key(source: Path, *extra: object) -> str:
+    """Cache key for a source file: its path, mtime and size plus ``extra``."""
+    stat = source.stat()
+    parts = [str(source), str(stat.st_mtime_ns), str(stat.st_size), *map(str, extra)]
+    return hashlib.blake2b("|".join(parts).encode("utf-8"), digest_size=16).hexdigest()
+
+
+def ensure_pcm16k(
+    path: Union[str, Path],
+    cache_dir: Optional[Union[str, Path]] = None,
+    max_bytes: int = DEFAULT_PCM_CACHE_MAX_BYTES,
+) -> Path:
+    """
+    Transcode an audio file to 16 kHz mono int16 PCM WAV, once.
+
+    The result is cached on disk keyed by the source path, mtime and size,
+    so repeated transcriptions of an unchanged file skip the transcode.
+    Least-recently-used copies are evicted once the cache exceeds ``max_bytes``.
+
+    Args:
+        path: Source audio file
+        cache_dir: Where to keep transcoded copies (default: ~/.praisonai/cache/pcm)
+        max_bytes: Size cap for the PCM cache
+
+    Returns:
+        Path to the PCM WAV file
+    """
+    source = Path(path).resolve()
+    key = _source_key(source)
+    cache = _pcm_cache(cache_dir, max_bytes)
+    cached = cache.get(key, "wav")
+    if cached is not None:
+        return cached
+
+    AudioSegment = _require_pydub()
+    audio = AudioSegment.from_file(str(source))
+    audio = (
+        audio.set_frame_rate(STT_SAMPLE_RATE)
+        .set_channels(STT_CHANNELS)
+        .set_sample_width(STT_SAMPLE_WIDTH)
+    )
+
+    tmp_path = cache.tmp_path_for(key, "wav")
+    audio.export(str(tmp_path), format="wav")
+    target = cache.put_file(key, "wav", tmp_path)
+    logger.debug("Transcoded %s to PCM at %s", source, target)
+    return target
+
+
+@dataclass
+class TrimResult:
+    """Silence-trimmed audio plus the mapping back to the original timeline."""
+    path: Path
+    # (original_start, original_end) in seconds for each kept span, in order
+    segments: List[Tuple[float, float]] = field(default_factory=list)
+
+    def to_original(self, t: float) -> float:
+        """Map a timestamp in the trimmed audio back to the original audio."""
+        elapsed = 0.0
+        for start, end in self.segments:
+            length = end - start
+            if t <= elapsed + length:
+                return start + (t - elapsed)
+            elapsed += length
+        if self.segments:
+            return self.segments[-1][1]
+        return t
+
+
+def trim_silence(
+    path: Union[str, Path],
+    aggressiveness: int = 2,
+    max_silence: float = 0.8,
+    keep_silence: float = 0.2,
+    cache_dir: Optional[Union[str, Path]] = None,
+    max_bytes: int = DEFAULT_PCM_CACHE_MAX_BYTES,
+) -> TrimResult:
+    """
+    Shorten long silences in a 16 kHz mono int16 WAV using WebRTC VAD.
+
+    Each silent run longer than ``max_silence`` seconds is cut down to
+    ``keep_silence`` seconds, split evenly around neighbouring speech
+    (leading and trailing runs keep only the side touching speech).
+
+    Args:
+        path: WAV file produced by ensure_pcm16k()
+        aggressiveness: webrtcvad mode, 0 (least) to 3 (most aggressive)
+        max_silence: Silences longer than this (seconds) are shortened
+        keep_silence: Silence (seconds) left in place of a shortened run
+        cache_dir: Where to keep trimmed copies (default: ~/.praisonai/cache/pcm),
+            in the same size-capped LRU cache as ensure_pcm16k()
+        max_bytes: Size cap for the PCM cache
+
+    Returns:
+        TrimResult for the trimmed WAV. If nothing is trimmed (or no
+        speech is detected) the original path is returned unchanged.
+    """
+    source = Path(path)
+
+    with wave.open(str(source), "rb") as wf:
+        if (wf.getframerate(), wf.getnchannels(), wf.getsampwidth()) != (
+            STT_SAMPLE_RATE, STT_CHANNELS, STT_SAMPLE_WIDTH
+        ):
+            raise ValueError("trim_silence() expects 16 kHz mono int16 WAV, see ensure_pcm16k()")
+        pcm = wf.readframes(wf.getnframes())
+    duration = len(pcm) / (STT_SAMPLE_RATE * STT_SAMPLE_WIDTH)
+
+    frame_bytes = STT_SAMPLE_RATE * _VAD_FRAME_MS // 1000 * STT_SAMPLE_WIDTH
+    frame_sec = _VAD_FRAME_MS / 1000
+    n_frames = len(pcm) // frame_bytes
+
+    vad = _require_webrtcvad().Vad(aggressiveness)
+    voiced = [
+        vad.is_speech(pcm[i * frame_bytes:(i + 1) * frame_bytes], STT_SAMPLE_RATE)
+        for i in range(n_frames)
+    ]
+    if not any(voiced):
+        return TrimResult(path=source, segments=[(0.0, duration)])
+
+    max_frames = int(max_silence / frame_sec)
+    keep_frames = int(keep_silence / frame_sec)
+
+    # Mark frames to keep: all speech, plus the edges of each silent run
+    keep = [True] * n_frames
+    i = 0
+    while i < n_frames:
+        if voiced[i]:
+            i += 1
+            continue
+        j = i
+        while j < n_frames and not voiced[j]:
+            j += 1
+        if j - i > max_frames:
+            leading, trailing = i == 0, j == n_frames
+            head = 0 if leading else (keep_frames if trailing else keep_frames // 2)
+            tail = 0 if trailing else (keep_frames if leading else keep_frames - keep_frames // 2)
+            for k in range(i + head, j - tail):
+                keep[k] = False
+        i = j
+
+    if all(keep):
+        return TrimResult(path=source, segments=[(0.0, duration)])
+
+    segments: List[Tuple[float, float]] = []
+    chunks = []
+    for k in range(n_frames):
+        if not keep[k]:
+            continue
+        chunks.append(pcm[k * frame_bytes:(k + 1) * frame_bytes])
+        start = k * frame_sec
+        if segments and abs(segments[-1][1] - start) < 1e-9:
+            segments[-1] = (segments[-1][0], start + frame_sec)
+        else:
+            segments.append((start, start + frame_sec))
+
+    cache = _pcm_cache(cache_dir, max_bytes)
+    key = _source_key(source.resolve(), "trim", aggressiveness, max_silence, keep_silence)
+    target = cache.get(key, "wav")
+    if target is None:
+        tmp_path = cache.tmp_path_for(key, "wav")
+        with wave.open(str(tmp_path), "wb") as wf:
+            wf.setnchannels(STT_CHANNELS)
+            wf.setsampwidth(STT_SAMPLE_WIDTH)
+            wf.setframerate(STT_SAMPLE_RATE)
+            wf.writeframes(b"".join(chunks))
+        target = cache.put_file(key, "wav", tmp_path)
+
+    logger.debug(
+        "Trimmed %s from %.1fs to %.1fs",
+        source, duration, sum(e - s for s, e in segments),
+    )
+    return TrimResult(path=target, segments=segments)
+
+
+def split_audio(
+    path: str,
+    chunk_seconds: float = 30.0,
+    overlap_seconds: float = 1.0,
+) -> List[AudioShard]:
+    """
+    Split an audio file into overlapping shards.
+
+    Args:
+        path: Path to the audio file
+        chunk_seconds: Length of each shard in seconds
+        overlap_seconds: Overlap between consecutive shards in seconds
+
+    Returns:
+        Shards in playback order. Audio no longer than ``chunk_seconds``
+        yields a single shard.
+    """
+    if chunk_seconds <= 0:
+        raise ValueError("chunk_seconds must be positive")
+    if overlap_seconds < 0 or overlap_seconds >= chunk_seconds:
+        raise ValueError("overlap_seconds must be between 0 and chunk_seconds")
+    chunk_ms = int(chunk_seconds * 1000)
+    step_ms = int((chunk_seconds - overlap_seconds) * 1000)
+    if chunk_ms <= 0 or step_ms <= 0:
+        raise ValueError("chunk_seconds - overlap_seconds must be at least 1 ms")
+
+    AudioSegment = _require_pydub()
+    audio = AudioSegment.from_file(path)
+    audio = (
+        audio.set_frame_rate(STT_SAMPLE_RATE)
+        .set_channels(STT_CHANNELS)
+        .set_sample_width(STT_SAMPLE_WIDTH)
+    )
+
+    total_ms = len(audio)
+
+    shards = []
+    start_ms = 0
+    while True:
+        end_ms = min(start_ms + chunk_ms, total_ms)
+        buf = io.BytesIO()
+        audio[start_ms:end_ms].export(buf, format="wav")
+        shards.append(AudioShard(
+            index=len(shards),
+            start=start_ms / 1000,
+            end=end_ms / 1000,
+            data=buf.getvalue(),
+        ))
+        if end_ms >= total_ms:
+            break
+        start_ms += step_ms
+
+    logger.debug("Split %s into %d shards", path, len(shards))
+    return shards
+
+
+def pcm_to_wav_file(
+    pcm: bytes,
+    sample_rate: int,
+    name: str = "audio.wav",
+    channels: int = STT_CHANNELS,
+    sample_width: int = STT_SAMPLE_WIDTH,
+) -> io.BytesIO:
+    """
+    Wrap raw little-endian PCM in a WAV header, entirely in memory.
+
+    Args:
+        pcm: Raw PCM sample bytes
+        sample_rate: Sample rate of ``pcm`` in Hz
+        name: File name reported to the STT provider
+        channels: Channel count of ``pcm``
+        sample_width: Bytes per sample of ``pcm``
+
+    Returns:
+        Named file-like object ready for upload
+    """
+    buf = io.BytesIO()
+    with wave.open(buf, "wb") as wf:
+        wf.setnchannels(channels)
+        wf.setsampwidth(sample_width)
+        wf.setframerate(sample_rate)
+        wf.writeframes(pcm)
+    buf.seek(0)
+    buf.name = name
+    return buf
+
+
+def _normalize_word(word: str) -> str:
+    return _WORD_NORMALIZE_RE.sub("", word).lower()
+
+
+def stitch_transcripts(texts: List[str], max_ngram: int = _MAX_STITCH_NGRAM) -> str:
+    """
+    Join shard transcripts, dropping words repeated across the overlap.
+
+    For each shard, the longest run of 1..max_ngram words that ends the
+    text confirmed so far and also starts the new shard is skipped.
+
+    Args:
+        texts: Transcripts in shard order
+        max_ngram: Longest overlap (in words) to look for
+
+    Returns:
+        The combined transcript
+    """
+    words: List[str] = []
+    for text in texts:
+        new_words = text.split()
+        if not new_words:
+            continue
+        tail = [_normalize_word(w) for w in words[-max_ngram:]]
+        head = [_normalize_word(w) for w in new_words[:max_ngram]]
+        skip = 0
+        for n in range(min(len(tail), len(head)), 0, -1):
+            if tail[-n:] == head[:n]:
+                skip = n
+                break
+        words.extend(new_words[skip:])
+    return " ".join(words)
+
+
+__all__ = [
+    "AudioShard",
+    "TrimResult",
+    "ensure_pcm16k",
+    "get_pcm_cache_dir",
+    "pcm_to_wav_file",
+    "split_audio",
+    "stitch_transcripts",
+    "trim_silence",
+    "DEFAULT_PCM_CACHE_MAX_BYTES",
+    "STT_SAMPLE_RATE",
+]
@@ -0,0 +1,33 @@
+"""Tests for AudioAgent's pure helpers.
+
+Run with: python -m pytest praisonaiagents/agent/tests/test_audio_agent.py -v
+"""
+
+from praisonaiagents.agent.audio_agent import _MAX_CHUNK_WORDS, _split_sentences
+
+
+def test_split_sentences_on_terminal_punctuation():
+    assert _split_sentences("Hello there. How are you? Great!") == [
+        "Hello there.", "How are you?", "Great!",
+    ]
+
+
+def test_split_sentences_keeps_closing_quotes():
+    assert _split_sentences('He said "stop." Then left.') == ['He said "stop."', "Then left."]
+
+
+def test_split_sentences_on_comma_only_after_min_words():
+    assert _split_sentences("Yes, I know.") == ["Yes, I know."]
+    assert _split_sentences("One two three four, five six.") == [
+        "One two three four,", "five six.",
+    ]
+
+
+def test_split_sentences_caps_run_on_text():
+    chunks = _split_sentences(" ".join(["word"] * (_MAX_CHUNK_WORDS + 5)))
+    assert [len(c.split()) for c in chunks] == [_MAX_CHUNK_WORDS, 5]
+
+
+def test_split_sentences_keeps_trailing_fragment_and_empty_input():
+    assert _split_sentences("Done. and then") == ["Done.", "and then"]
+    assert _split_sentences("   ") == []
@@ -0,0 +1,69 @@
+"""Tests for the disk-backed LRU TTSCache used by AudioAgent.speech(cache=True).
+
+Run with: python -m pytest praisonaiagents/agent/tests/test_audio_cache.py -v
+"""
+
+import json
+
+from praisonaiagents.agent.audio_cache import TTSCache
+
+
+def _put(cache, key, size, atime):
+    cache.put(key, "mp3", b"x" * size)
+    # Pin the access time so eviction order does not depend on clock resolution
+    index = cache._load_index()
+    index[key][1] = atime
+    cache._save_index(index)
+
+
+def test_make_key_ignores_credentials_and_order():
+    a = TTSCache.make_key({"model": "openai/tts-1", "input": "Hi", "api_key": "sk-1"})
+    b = TTSCache.make_key({"input": "Hi", "model": "openai/tts-1", "api_key": "sk-2", "timeout": 5})
+    assert a == b
+    assert a != TTSCache.make_key({"model": "openai/tts-1", "input": "Hello"})
+
+
+def test_put_then_get_roundtrip(tmp_path):
+    cache = TTSCache(tmp_path)
+    assert cache.get("k", "mp3") is None
+    path = cache.put("k", "mp3", b"audio")
+    assert cache.get("k", "mp3") == path
+    assert path.read_bytes() == b"audio"
+    assert not list(tmp_path.glob("*.tmp"))
+
+
+def test_evicts_least_recently_used_first(tmp_path):
+    cache = TTSCache(tmp_path, max_bytes=25)
+    _put(cache, "old", 10, atime=1)
+    _put(cache, "mid", 10, atime=2)
+    cache.put("new", "mp3", b"x" * 10)
+
+    index = json.loads((tmp_path / TTSCache.INDEX_FILE).read_text())
+    assert set(index) == {"mid", "new"}
+    assert not cache.path_for("old", "mp3").exists()
+    assert cache.path_for("mid", "mp3").exists()
+
+
+def test_get_refreshes_recency(tmp_path):
+    cache = TTSCache(tmp_path, max_bytes=25)
+    _put(cache, "old", 10, atime=1)
+    _put(cache, "mid", 10, atime=2)
+    cache.get("old", "mp3")
+    cache.put("new", "mp3", b"x" * 10)
+
+    assert cache.path_for("old", "mp3").exists()
+    assert not cache.path_for("mid", "mp3").exists()
+
+
+def test_oversized_entry_is_kept(tmp_path):
+    cache = TTSCache(tmp_path, max_bytes=5)
+    _put(cache, "small", 4, atime=1)
+    cache.put("big", "mp3", b"x" * 10)
+
+    assert cache.path_for("big", "mp3").exists()
+    assert not cache.path_for("small", "mp3").exists()
+
+
+def test_caches_on_same_dir_share_a_lock(tmp_path):
+    assert TTSCache(tmp_path)._lock is TTSCache(str(tmp_path))._lock
+    assert TTSCache(tmp_path)._lock is not TTSCache(tmp_path / "other")._lock
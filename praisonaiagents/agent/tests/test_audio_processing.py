@@ -0,0 +1,114 @@
+"""Tests for the client-side STT audio helpers in audio_processing.
+
+Run with: python -m pytest praisonaiagents/agent/tests/test_audio_processing.py -v
+"""
+
+import sys
+import types
+import wave
+
+import pytest
+
+from praisonaiagents.agent.audio_processing import (
+    STT_SAMPLE_RATE,
+    stitch_transcripts,
+    trim_silence,
+)
+
+# 30 ms VAD frame of 16 kHz int16 audio
+FRAME_BYTES = STT_SAMPLE_RATE * 30 // 1000 * 2
+FRAME_SEC = 0.03
+SPEECH = b"\x01\x00" * (FRAME_BYTES // 2)
+SILENCE = b"\x00" * FRAME_BYTES
+
+
+@pytest.fixture
+def fake_vad(monkeypatch):
+    """Stub webrtcvad: a frame is speech iff it has any non-zero byte."""
+    class Vad:
+        def __init__(self, mode):
+            self.mode = mode
+
+        def is_speech(self, frame, sample_rate):
+            return any(frame)
+
+    monkeypatch.setitem(sys.modules, "webrtcvad", types.SimpleNamespace(Vad=Vad))
+
+
+def _write_wav(path, frames, rate=STT_SAMPLE_RATE):
+    with wave.open(str(path), "wb") as wf:
+        wf.setnchannels(1)
+        wf.setsampwidth(2)
+        wf.setframerate(rate)
+        wf.writeframes(b"".join(frames))
+    return path
+
+
+def _flat(segments):
+    return [t for span in segments for t in span]
+
+
+def _frame_count(path):
+    with wave.open(str(path), "rb") as wf:
+        return wf.getnframes() * 2 // FRAME_BYTES
+
+
+def test_stitch_drops_repeated_overlap_words():
+    assert stitch_transcripts(["the quick brown fox", "brown fox jumps over"]) == (
+        "the quick brown fox jumps over"
+    )
+
+
+def test_stitch_ignores_case_and_punctuation_on_overlap():
+    assert stitch_transcripts(["I said Hello,", "hello there."]) == "I said Hello, there."
+
+
+def test_stitch_prefers_longest_overlap():
+    assert stitch_transcripts(["a b a b", "a b c"]) == "a b a b c"
+
+
+def test_stitch_without_overlap_and_empty_shards():
+    assert stitch_transcripts(["one two", "", "three"]) == "one two three"
+    assert stitch_transcripts([]) == ""
+
+
+def test_stitch_respects_max_ngram():
+    assert stitch_transcripts(["x a b c", "a b c y"], max_ngram=2) == "x a b c a b c y"
+
+
+def test_trim_shortens_long_inner_silence(tmp_path, fake_vad):
+    src = _write_wav(tmp_path / "in.wav", [SPEECH] * 10 + [SILENCE] * 40 + [SPEECH] * 10)
+    result = trim_silence(src, cache_dir=tmp_path / "pcm")
+
+    # keep_silence=0.2s is 6 frames, split 3 / 3 around the cut
+    assert result.path != src
+    assert _frame_count(result.path) == 26
+    assert _flat(result.segments) == pytest.approx([0.0, 13 * FRAME_SEC, 47 * FRAME_SEC, 60 * FRAME_SEC])
+    assert result.to_original(13 * FRAME_SEC + 0.01) == pytest.approx(47 * FRAME_SEC + 0.01)
+
+
+def test_trim_keeps_only_speech_side_of_edge_silence(tmp_path, fake_vad):
+    src = _write_wav(tmp_path / "in.wav", [SILENCE] * 30 + [SPEECH] * 10 + [SILENCE] * 30)
+    result = trim_silence(src, cache_dir=tmp_path / "pcm")
+
+    assert _frame_count(result.path) == 22
+    assert _flat(result.segments) == pytest.approx([24 * FRAME_SEC, 46 * FRAME_SEC])
+
+
+def test_trim_leaves_short_silence_untouched(tmp_path, fake_vad):
+    src = _write_wav(tmp_path / "in.wav", [SPEECH] * 10 + [SILENCE] * 20 + [SPEECH] * 10)
+    result = trim_silence(src, cache_dir=tmp_path / "pcm")
+
+    assert result.path == src
+    assert _flat(result.segments) == pytest.approx([0.0, 40 * FRAME_SEC])
+
+
+def test_trim_without_speech_returns_original(tmp_path, fake_vad):
+    src = _write_wav(tmp_path / "in.wav", [SILENCE] * 50)
+    assert trim_silence(src, cache_dir=tmp_path / "pcm").path == src
+
+
+def test_trim_rejects_non_16k_wav(tmp_path, fake_vad):
+    src = _write_wav(tmp_path / "in.wav", [SPEECH] * 10, rate=8000)
+    with pytest.raises(ValueError):
+        trim_silence(src, cache_dir=tmp_path / "pcm")
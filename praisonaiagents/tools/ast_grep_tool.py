@@ -9,11 +9,15 @@ Features:
 - Structural code search using AST patterns
 - Structural code rewrite (dry-run by default)
 - YAML rule scanning
+- In-process single-file search via ast-grep-py when installed
+- Streaming search results (ast_grep_search_iter) for large codebases
 - Graceful fallback when not installed
-- Zero performance impact when not used (lazy loading)
+- Zero performance impact when not used (lazy loading; shutil is only
+  imported when availability is checked)
 
 Installation:
     pip install ast-grep-cli
+    pip install ast-grep-py  # optional: in-process single-file search
 
 Usage:
     from praisonaiagents import Agent
@@ -25,18 +29,20 @@ Usage:
     )
 """
 
-import shutil
+import json
+import logging
+import os
+import re
 import subprocess
+from functools import cache, partial
 from praisonaiagents._logging import get_logger
-from typing import Optional, List
+from typing import Any, Callable, Dict, Iterator, Optional, List
 
 from ..approval import require_approval
 
 logger = get_logger(__name__)
 
-# Availability cache for performance (checked once per process)
-_availability_cache: Optional[bool] = None
-
+@cache
 def is_ast_grep_available() -> bool:
     """Check if ast-grep (sg) CLI is available.
     
@@ -44,24 +50,333 @@ def is_ast_grep_available() -> bool:
         True if sg binary is found in PATH, False otherwise.
         
     Note:
-        Result is cached for performance. First call checks PATH,
-        subsequent calls return cached result.
+        Result is cached for the lifetime of the process. Call
+        ``is_ast_grep_available.cache_clear()`` to re-check PATH.
     """
-    global _availability_cache
-    
-    if _availability_cache is not None:
-        return _availability_cache
+    import shutil
     
-    # Check if sg binary is in PATH
     sg_path = shutil.which('sg')
-    _availability_cache = sg_path is not None
     
-    if _availability_cache:
-        logger.debug(f"ast-grep found at: {sg_path}")
+    if sg_path:
+        logger.debug("ast-grep found at: %s", sg_path)
     else:
         logger.debug("ast-grep (sg) not found in PATH")
     
-    return _availability_cache
+    return sg_path is not None
+
+# File extensions searched in-process per language (mirrors sg's defaults)
+_LANG_EXTENSIONS = {
+    'python': ('.py', '.pyi'),
+    'javascript': ('.js', '.mjs', '.cjs', '.jsx'),
+    'typescript': ('.ts', '.mts', '.cts'),
+    'tsx': ('.tsx',),
+    'rust': ('.rs',),
+    'go': ('.go',),
+    'java': ('.java',),
+    'kotlin': ('.kt', '.ktm', '.kts'),
+    'c': ('.c', '.h'),
+    'cpp': ('.cc', '.cpp', '.cxx', '.hh', '.hpp', '.hxx', '.h'),
+    'csharp': ('.cs',),
+    'ruby': ('.rb',),
+    'php': ('.php',),
+    'swift': ('.swift',),
+    'lua': ('.lua',),
+    'html': ('.html', '.htm'),
+    'css': ('.css',),
+}
+
+_LANG_ALIASES = {
+    'py': 'python',
+    'js': 'javascript',
+    'jsx': 'javascript',
+    'ts': 'typescript',
+    'rs': 'rust',
+    'golang': 'go',
+    'kt': 'kotlin',
+    'cc': 'cpp',
+    'c++': 'cpp',
+    'cs': 'csharp',
+    'rb': 'ruby',
+}
+
+# A '$' followed by a lower-case name, e.g. $fn or $$args: never a valid
+# ast-grep metavariable (names are upper-case: $NAME / $$$NAME / $$$)
+_LOWER_METAVAR_RE = re.compile(r'\$[a-z]')
+
+# Quoted string literals, blanked out before the check so "$5" is allowed
+_STRING_LITERAL_RE = re.compile(r'"(?:[^"\\\n]|\\.)*"|\'(?:[^\'\\\n]|\\.)*\'|`[^`]*`')
+
+# Languages where '$name' is not valid code outside a string literal
+# (PHP, JS/TS, Java, shell, Ruby, Swift, Kotlin and Rust macros use '$')
+_STRICT_METAVAR_LANGS = frozenset({'python', 'go', 'c', 'cpp', 'csharp', 'lua'})
+
+_INVALID_METAVAR_MESSAGE = (
+    "pattern contains a lower-case '$name', which is not a valid metavariable "
+    "(metavariable names must be upper-case, e.g. $FN or $$$ARGS)"
+)
+
+# Language names as sg reports them in JSON output
+_SG_LANGUAGE_NAMES = {
+    'javascript': 'JavaScript',
+    'typescript': 'TypeScript',
+    'csharp': 'CSharp',
+}
+
+# Capturing metavariable names: $$$NAME (multi) and $NAME (single)
+_MULTI_VAR_NAME_RE = re.compile(r'\$\$\$([A-Z_][A-Z0-9_]*)')
+_SINGLE_VAR_NAME_RE = re.compile(r'(?<!\$)\$([A-Z_][A-Z0-9_]*)')
+
+# Directories skipped by the in-process walker (sg also honours .gitignore)
+_SKIP_DIRS = frozenset({'node_modules', '__pycache__', 'venv', 'target', 'dist', 'build'})
+
+@cache
+def _load_ast_grep_py() -> Optional[Any]:
+    """Import ast-grep-py once; returns None if it is not installed."""
+    try:
+        import ast_grep_py
+        return ast_grep_py
+    except ImportError:
+        return None
+
+def _iter_source_files(path: str, extensions: tuple):
+    """Yield files under ``path`` with a matching extension, skipping hidden/vendored dirs."""
+    if os.path.isfile(path):
+        yield path
+        return
+    for root, dirs, files in os.walk(path):
+        dirs[:] = sorted(
+            d for d in dirs if not d.startswith('.') and d not in _SKIP_DIRS
+        )
+        for name in sorted(files):
+            if name.endswith(extensions):
+                yield os.path.join(root, name)
+
+def _char_to_byte(source: str, index: int) -> int:
+    """Convert a character offset in ``source`` to a UTF-8 byte offset."""
+    return len(source[:index].encode('utf-8'))
+
+def _range_json(rng: Any, to_byte: Callable[[int], int]) -> Dict[str, Any]:
+    """Convert an ast-grep-py Range to sg's JSON range format.
+    
+    ast-grep-py indexes are character offsets; sg reports UTF-8 byte
+    offsets, converted here with ``to_byte``.
+    """
+    return {
+        'byteOffset': {'start': to_byte(rng.start.index), 'end': to_byte(rng.end.index)},
+        'start': {'line': rng.start.line, 'column': rng.start.column},
+        'end': {'line': rng.end.line, 'column': rng.end.column},
+    }
+
+def _meta_variables_json(
+    node: Any,
+    names: tuple,
+    multi_names: tuple,
+    to_byte: Callable[[int], int],
+) -> Dict[str, Any]:
+    """Build sg's ``metaVariables`` object for a match from ast-grep-py captures."""
+    single = {}
+    for name in names:
+        captured = node.get_match(name)
+        if captured is not None:
+            single[name] = {'text': captured.text(), 'range': _range_json(captured.range(), to_byte)}
+    multi = {
+        name: [
+            {'text': captured.text(), 'range': _range_json(captured.range(), to_byte)}
+            for captured in node.get_multiple_matches(name)
+        ]
+        for name in multi_names
+    }
+    return {'single': single, 'multi': multi, 'transformed': {}}
+
+def _iter_in_process(pattern: str, lang: str, path: str) -> Iterator[Dict[str, Any]]:
+    """Yield sg-style JSON matches found with ast-grep-py, file by file.
+    
+    Callers must check _in_process_language() first.
+    """
+    ast_grep_py = _load_ast_grep_py()
+    language = _LANG_ALIASES.get(lang.lower(), lang.lower())
+    sg_language = _SG_LANGUAGE_NAMES.get(language, language.capitalize())
+    # $_ and $$$ are non-capturing, so they are not reported
+    multi_names = tuple(dict.fromkeys(
+        n for n in _MULTI_VAR_NAME_RE.findall(pattern) if not n.startswith('_')
+    ))
+    names = tuple(dict.fromkeys(
+        n for n in _SINGLE_VAR_NAME_RE.findall(pattern) if not n.startswith('_')
+    ))
+    for file_path in _iter_source_files(path, _LANG_EXTENSIONS[language]):
+        try:
+            with open(file_path, 'r', encoding='utf-8') as f:
+                source = f.read()
+        except (OSError, UnicodeDecodeError):
+            continue
+        root = ast_grep_py.SgRoot(source, language).root()
+        nodes = root.find_all(pattern=pattern)
+        if not nodes:
+            continue
+        source_lines = source.splitlines()
+        to_byte = int if source.isascii() else partial(_char_to_byte, source)
+        for node in nodes:
+            rng = node.range()
+            yield {
+                'text': node.text(),
+                'range': _range_json(rng, to_byte),
+                'file': file_path,
+                'lines': '\n'.join(source_lines[rng.start.line:rng.end.line + 1]),
+                'charCount': {
+                    'leading': rng.start.column,
+                    'trailing': max(0, len(source_lines[rng.end.line]) - rng.end.column)
+                    if rng.end.line < len(source_lines) else 0,
+                },
+                'language': sg_language,
+                'metaVariables': _meta_variables_json(node, names, multi_names, to_byte),
+            }
+
+def _in_process_language(lang: str, path: str) -> Optional[str]:
+    """Return the ast-grep-py language name, or None if in-process search shouldn't be used.
+    
+    In-process search covers single files. Directories go to the sg CLI,
+    which honours .gitignore and walks in parallel; the in-process walker
+    is only a fallback for them when sg is not installed.
+    """
+    if _load_ast_grep_py() is None:
+        return None
+    language = _LANG_ALIASES.get(lang.lower(), lang.lower())
+    if language not in _LANG_EXTENSIONS:
+        return None
+    if not os.path.isfile(path) and is_ast_grep_available():
+        return None
+    return language
+
+@cache
+def _json_loads():
+    """Return orjson.loads when installed (faster), else json.loads."""
+    try:
+        import orjson
+        return orjson.loads
+    except ImportError:
+        return json.loads
+
+# Sharded CLI runs only kick in for directories with more subdirectories than this
+_MIN_SHARD_DIRS = 4
+
+def _git_ignored_names(path: str, names: List[str]) -> set:
+    """Return the entries of ``path`` that git ignores (empty outside a git repo)."""
+    if not names:
+        return set()
+    try:
+        result = subprocess.run(
+            ['git', '-C', path, 'check-ignore', '-z', '--stdin'],
+            input='\0'.join(names) + '\0',
+            capture_output=True,
+            text=True,
+            timeout=10,
+        )
+    except (OSError, subprocess.SubprocessError):
+        return set()
+    # Exit code 1 means nothing is ignored; 128 means not a repo / no git
+    if result.returncode != 0:
+        return set()
+    return {name for name in result.stdout.split('\0') if name}
+
+def _shard_paths(
+    path: str,
+    workers: int,
+    extensions: Optional[tuple] = None,
+) -> Optional[List[List[str]]]:
+    """Split a directory into ``workers`` buckets of top-level entries.
+    
+    sg applies .gitignore and hidden-file rules only to paths it walks,
+    not to paths passed explicitly, so those rules are applied here to
+    the top-level entries. Loose top-level files are kept only if they
+    match ``extensions`` (when given).
+    
+    Returns None when sharding is not worthwhile (a file, a small tree,
+    or a single worker) so the caller runs one sg process on ``path``.
+    """
+    if workers <= 1 or not os.path.isdir(path):
+        return None
+    try:
+        entries = sorted(os.scandir(path), key=lambda e: e.name)
+    except OSError:
+        return None
+    entries = [e for e in entries if not e.name.startswith('.')]
+    if sum(1 for e in entries if e.is_dir()) <= _MIN_SHARD_DIRS:
+        return None
+    ignored = _git_ignored_names(path, [e.name for e in entries])
+    entries = [e for e in entries if e.name not in ignored]
+    subs = [e.path for e in entries if e.is_dir()]
+    if len(subs) <= _MIN_SHARD_DIRS:
+        return None
+    files = [
+        e.path for e in entries
+        if e.is_file() and (extensions is None or e.name.endswith(extensions))
+    ]
+    
+    n_buckets = min(workers, len(subs))
+    buckets: List[List[str]] = [[] for _ in range(n_buckets)]
+    for i, sub in enumerate(subs):
+        buckets[i % n_buckets].append(sub)
+    if files:
+        buckets[0].extend(files)
+    return buckets
+
+def _run_sg(
+    cmd: List[str],
+    path: str,
+    timeout: int,
+    workers: Optional[int] = None,
+    extensions: Optional[tuple] = None,
+) -> List[subprocess.CompletedProcess]:
+    """Run ``cmd + [path]``, sharded across ``workers`` sg processes for large trees.
+    
+    Results are returned in bucket order so merged output is deterministic.
+    """
+    buckets = _shard_paths(path, workers or 1, extensions)
+    if buckets is None:
+        return [subprocess.run(cmd + [path], capture_output=True, text=True, timeout=timeout)]
+    
+    from concurrent.futures import ThreadPoolExecutor
+    
+    def run_bucket(bucket: List[str]) -> subprocess.CompletedProcess:
+        return subprocess.run(cmd + bucket, capture_output=True, text=True, timeout=timeout)
+    
+    with ThreadPoolExecutor(max_workers=len(buckets)) as executor:
+        return list(executor.map(run_bucket, buckets))
+
+def _kill_process_group(proc: subprocess.Popen) -> None:
+    """Kill ``proc`` and, on POSIX, the rest of its process group."""
+    if os.name == 'posix':
+        import signal
+        try:
+            os.killpg(proc.pid, signal.SIGKILL)
+            return
+        except OSError:
+            pass
+    try:
+        proc.kill()
+    except OSError:
+        pass
+
+def _has_invalid_metavariable(pattern: str, lang: str) -> bool:
+    """Cheap client-side check for a '$' that cannot be a metavariable.
+    
+    Catches patterns like "def $fn($$args)" before paying for an sg
+    process that would only reject them.
+    """
+    if '$' not in pattern:
+        return False
+    if _LANG_ALIASES.get(lang.lower(), lang.lower()) not in _STRICT_METAVAR_LANGS:
+        return False
+    code = _STRING_LITERAL_RE.sub('""', pattern)
+    return _LOWER_METAVAR_RE.search(code) is not None
+
+def _log_unexpected_error(fn_name: str, error: Exception) -> None:
+    """Log an unexpected tool error; the traceback is only captured at DEBUG level."""
+    if logger.isEnabledFor(logging.ERROR):
+        logger.error(
+            "Unexpected error in %s: %s", fn_name, error,
+            exc_info=logger.isEnabledFor(logging.DEBUG),
+        )
 
 def _get_not_installed_message() -> str:
     """Get helpful error message when ast-grep is not installed."""
@@ -79,6 +394,7 @@ def ast_grep_search(
     lang: str,
     path: str = ".",
     json_output: bool = True,
+    workers: Optional[int] = None,
 ) -> str:
     """Search code using AST patterns.
     
@@ -94,6 +410,11 @@ def ast_grep_search(
             rust, go, java, c, cpp, etc.)
         path: Directory or file to search in. Defaults to current directory.
         json_output: Whether to return JSON format. Defaults to True.
+            JSON searches of a single file run in-process via ast-grep-py
+            when it is installed, avoiding a subprocess per call.
+        workers: Opt-in number of parallel sg processes for large
+            directories (split by top-level subdirectory). Defaults to
+            None, a single sg process.
         
     Returns:
         Search results as JSON string (if json_output=True) or plain text.
@@ -109,44 +430,146 @@ def ast_grep_search(
         # Find all async functions
         result = ast_grep_search("async def $FN($$$)", lang="python")
     """
-    if not is_ast_grep_available():
+    in_process = json_output and _in_process_language(lang, path) is not None
+    
+    if not in_process and not is_ast_grep_available():
         return _get_not_installed_message()
     
     if not pattern:
         return "Error: Pattern cannot be empty"
     
+    if _has_invalid_metavariable(pattern, lang):
+        return f"Error: {_INVALID_METAVAR_MESSAGE}"
+    
     try:
+        if in_process:
+            matches = list(_iter_in_process(pattern, lang, path))
+            if not matches:
+                return "No matches found"
+            return json.dumps(matches, indent=2, ensure_ascii=False)
+        
         cmd = ['sg', '--pattern', pattern, '--lang', lang]
         
         if json_output:
             cmd.append('--json')
         
-        cmd.append(path)
-        
-        result = subprocess.run(
-            cmd,
-            capture_output=True,
-            text=True,
-            timeout=60,
+        language = _LANG_ALIASES.get(lang.lower(), lang.lower())
+        results = _run_sg(
+            cmd, path, timeout=60, workers=workers,
+            extensions=_LANG_EXTENSIONS.get(language),
         )
         
-        if result.returncode != 0 and result.stderr:
-            return f"Error: {result.stderr}"
+        for result in results:
+            if result.returncode != 0 and result.stderr:
+                return f"Error: {result.stderr}"
         
-        output = result.stdout.strip()
-        if not output:
+        outputs = [r.stdout.strip() for r in results if r.stdout.strip()]
+        if not outputs:
             return "No matches found"
         
-        return output
+        if len(outputs) == 1:
+            return outputs[0]
+        if json_output:
+            merged = []
+            for output in outputs:
+                merged.extend(json.loads(output))
+            return json.dumps(merged, indent=2, ensure_ascii=False) if merged else "No matches found"
+        return "\n".join(outputs)
         
     except subprocess.TimeoutExpired:
         return "Error: Search timed out after 60 seconds"
     except subprocess.SubprocessError as e:
         return f"Error executing ast-grep: {e}"
     except Exception as e:
-        logger.exception("Unexpected error in ast_grep_search")
+        _log_unexpected_error("ast_grep_search", e)
         return f"Error: {e}"
 
+def ast_grep_search_iter(
+    pattern: str,
+    lang: str,
+    path: str = ".",
+    timeout: float = 60,
+) -> Iterator[Dict[str, Any]]:
+    """Search code using AST patterns, yielding matches as they are found.
+    
+    Streaming counterpart of ast_grep_search() for programmatic use:
+    matches are parsed one at a time from ``sg --json=stream`` (or found
+    via ast-grep-py for a single file), so memory stays flat on large
+    codebases and the first match is available immediately.
+    
+    Args:
+        pattern: AST pattern to search for (see ast_grep_search).
+        lang: Programming language.
+        path: Directory or file to search in. Defaults to current directory.
+        timeout: Seconds the sg process may run, counted from the first
+            ``next()``; it is killed once the deadline passes.
+        
+    Yields:
+        One dict per match, in sg's JSON match format.
+        
+    Raises:
+        ValueError: If the pattern is empty or has a malformed metavariable.
+        RuntimeError: If ast-grep is not installed or sg fails.
+        TimeoutError: If sg is still running after ``timeout`` seconds.
+        
+    Example:
+        for match in ast_grep_search_iter("def $FN($$$)", lang="python"):
+            print(match["file"], match["range"]["start"]["line"])
+    """
+    if not pattern:
+        raise ValueError("Pattern cannot be empty")
+    
+    if _has_invalid_metavariable(pattern, lang):
+        raise ValueError(_INVALID_METAVAR_MESSAGE)
+    
+    if _in_process_language(lang, path) is not None:
+        yield from _iter_in_process(pattern, lang, path)
+        return
+    
+    if not is_ast_grep_available():
+        raise RuntimeError(_get_not_installed_message())
+    
+    import tempfile
+    import threading
+    
+    loads = _json_loads()
+    # stderr goes to a temp file: a PIPE only read after stdout can fill
+    # up and deadlock sg while we are still waiting on stdout
+    stderr_file = tempfile.TemporaryFile(mode='w+')
+    proc = subprocess.Popen(
+        ['sg', '--pattern', pattern, '--lang', lang, '--json=stream', path],
+        stdout=subprocess.PIPE,
+        stderr=stderr_file,
+        text=True,
+        # Own process group, so a kill also reaches the ast-grep child
+        # that the pip-installed sg shim spawns
+        start_new_session=os.name == 'posix',
+    )
+    # Kill sg at the deadline even while blocked reading its stdout
+    timer = threading.Timer(timeout, _kill_process_group, args=(proc,))
+    timer.daemon = True
+    timer.start()
+    try:
+        for line in proc.stdout:
+            line = line.strip()
+            if line:
+                yield loads(line)
+        returncode = proc.wait()
+        if not timer.is_alive() and returncode != 0:
+            raise TimeoutError(f"ast-grep search timed out after {timeout} seconds")
+        if returncode != 0:
+            stderr_file.seek(0)
+            stderr = stderr_file.read()
+            if stderr:
+                raise RuntimeError(f"ast-grep failed: {stderr}")
+    finally:
+        timer.cancel()
+        if proc.poll() is None:
+            _kill_process_group(proc)
+            proc.wait()
+        proc.stdout.close()
+        stderr_file.close()
+
 @require_approval(risk_level="high")
 def ast_grep_rewrite(
     pattern: str,
@@ -202,6 +625,9 @@ def ast_grep_rewrite(
     if not replacement:
         return "Error: Replacement cannot be empty"
     
+    if _has_invalid_metavariable(pattern, lang):
+        return f"Error: {_INVALID_METAVAR_MESSAGE}"
+    
     try:
         cmd = [
             'sg', '--pattern', pattern,
@@ -239,12 +665,13 @@ def ast_grep_rewrite(
     except subprocess.SubprocessError as e:
         return f"Error executing ast-grep: {e}"
     except Exception as e:
-        logger.exception("Unexpected error in ast_grep_rewrite")
+        _log_unexpected_error("ast_grep_rewrite", e)
         return f"Error: {e}"
 
 def ast_grep_scan(
     path: str = ".",
     rule_file: Optional[str] = None,
+    workers: Optional[int] = None,
 ) -> str:
     """Scan code using YAML lint rules.
     
@@ -256,6 +683,9 @@ def ast_grep_scan(
         path: Directory or file to scan. Defaults to current directory.
         rule_file: Optional path to a specific YAML rule file.
             If not provided, looks for sgconfig.yml in the path.
+        workers: Opt-in number of parallel sg processes for large
+            directories (split by top-level subdirectory). Defaults to
+            None, a single sg process.
             
     Returns:
         Scan results as string.
@@ -280,19 +710,13 @@ def ast_grep_scan(
         if rule_file:
             cmd.extend(['--rule', rule_file])
         
-        cmd.append(path)
-        
-        result = subprocess.run(
-            cmd,
-            capture_output=True,
-            text=True,
-            timeout=120,
-        )
+        results = _run_sg(cmd, path, timeout=120, workers=workers)
         
         # scan returns non-zero if issues found, which is expected
-        output = result.stdout.strip()
-        if result.stderr and not output:
-            return f"Error: {result.stderr}"
+        output = "\n".join(r.stdout.strip() for r in results if r.stdout.strip())
+        stderr = "".join(r.stderr for r in results if r.stderr)
+        if stderr and not output:
+            return f"Error: {stderr}"
         
         if not output:
             return "No issues found"
@@ -304,7 +728,7 @@ def ast_grep_scan(
     except subprocess.SubprocessError as e:
         return f"Error executing ast-grep: {e}"
     except Exception as e:
-        logger.exception("Unexpected error in ast_grep_scan")
+        _log_unexpected_error("ast_grep_scan", e)
         return f"Error: {e}"
 
 # Convenience function to get all ast-grep tools
@@ -328,6 +752,7 @@ def get_ast_grep_tools() -> List:
 __all__ = [
     'is_ast_grep_available',
     'ast_grep_search',
+    'ast_grep_search_iter',
     'ast_grep_rewrite',
     'ast_grep_scan',
     'get_ast_grep_tools',
@@ -0,0 +1,105 @@
+"""Tests for the ast-grep tool's pure helpers (no sg binary needed).
+
+Run with: python -m pytest praisonaiagents/tools/tests/test_ast_grep_tool.py -v
+"""
+
+import os
+import shutil
+import subprocess
+
+import pytest
+
+from praisonaiagents.tools.ast_grep_tool import (
+    _MIN_SHARD_DIRS,
+    _has_invalid_metavariable,
+    _shard_paths,
+)
+
+
+def _make_tree(root, dirs, files=()):
+    for name in dirs:
+        (root / name).mkdir()
+    for name in files:
+        (root / name).write_text("")
+    return root
+
+
+def _names(buckets):
+    return [[os.path.basename(p) for p in bucket] for bucket in buckets]
+
+
+def test_shard_round_robins_subdirs_and_adds_files_to_first_bucket(tmp_path):
+    _make_tree(tmp_path, ["a", "b", "c", "d", "e", "f"], ["main.py", "README.md"])
+    buckets = _shard_paths(str(tmp_path), 4, (".py",))
+    assert _names(buckets) == [["a", "e", "main.py"], ["b", "f"], ["c"], ["d"]]
+
+
+def test_shard_keeps_all_files_without_extensions(tmp_path):
+    _make_tree(tmp_path, ["a", "b", "c", "d", "e"], ["main.py", "README.md"])
+    buckets = _shard_paths(str(tmp_path), 2)
+    assert sorted(_names(buckets)[0]) == ["README.md", "a", "c", "e", "main.py"]
+
+
+def test_shard_caps_buckets_at_subdir_count(tmp_path):
+    _make_tree(tmp_path, ["a", "b", "c", "d", "e"])
+    assert len(_shard_paths(str(tmp_path), 16)) == 5
+
+
+def test_shard_skips_hidden_entries(tmp_path):
+    _make_tree(tmp_path, [".git", ".venv", "a", "b", "c", "d", "e"])
+    buckets = _shard_paths(str(tmp_path), 5)
+    assert sorted(n for bucket in _names(buckets) for n in bucket) == ["a", "b", "c", "d", "e"]
+
+
+@pytest.mark.parametrize("workers", [0, 1])
+def test_shard_disabled_for_single_worker(tmp_path, workers):
+    _make_tree(tmp_path, ["a", "b", "c", "d", "e"])
+    assert _shard_paths(str(tmp_path), workers) is None
+
+
+def test_shard_disabled_for_small_trees_and_files(tmp_path):
+    _make_tree(tmp_path, [f"d{i}" for i in range(_MIN_SHARD_DIRS)], ["main.py"])
+    assert _shard_paths(str(tmp_path), 4) is None
+    assert _shard_paths(str(tmp_path / "main.py"), 4) is None
+
+
+@pytest.mark.skipif(shutil.which("git") is None, reason="git not installed")
+def test_shard_skips_git_ignored_dirs(tmp_path):
+    subprocess.run(["git", "init", "-q", str(tmp_path)], check=True)
+    _make_tree(tmp_path, ["a", "b", "c", "d", "e", "node_modules"])
+    (tmp_path / ".gitignore").write_text("node_modules/\n")
+    buckets = _shard_paths(str(tmp_path), 5)
+    assert "node_modules" not in {n for bucket in _names(buckets) for n in bucket}
+    # Dropping the ignored dir leaves too few to shard
+    (tmp_path / "e").rmdir()
+    assert _shard_paths(str(tmp_path), 5) is None
+
+
+@pytest.mark.parametrize("pattern", [
+    "def $fn($$$)",
+    "def $FN($$args)",
+    "foo($x, $Y)",
+])
+def test_metavariable_rejects_lower_case_names(pattern):
+    assert _has_invalid_metavariable(pattern, "python")
+
+
+@pytest.mark.parametrize("pattern", [
+    "def $FN($$$ARGS)",
+    "print($$$)",
+    "x = 1",
+    'print("$5 for $item")',
+    "print('$total')",
+])
+def test_metavariable_accepts_valid_patterns(pattern):
+    assert not _has_invalid_metavariable(pattern, "python")
+
+
+@pytest.mark.parametrize("lang", ["go", "c", "cpp", "csharp", "lua", "Python", "py"])
+def test_metavariable_check_applies_to_strict_languages(lang):
+    assert _has_invalid_metavariable("foo($x)", lang)
+
+
+@pytest.mark.parametrize("lang", ["javascript", "typescript", "php", "rust", "bash", "ruby"])
+def test_metavariable_check_skips_languages_using_dollar(lang):
+    assert not _has_invalid_metavariable("foo($x)", lang)